@@ -1,24 +1,39 @@
 ﻿"""PyQt5 GUI for the configurable web scraping application."""
 from __future__ import annotations
 
-import json
 import os
 import sqlite3
 import subprocess
 import sys
-import threading
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Deque, Dict, Optional, Tuple
 
-from PyQt5 import QtCore, QtWidgets
+from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtCore import pyqtSlot  # type: ignore[attr-defined]
 
-from scraper import ConfigError, LoginError, Scraper, ScraperError
+from scraper import ConfigError, LoginError, Scraper, ScraperError, load_config
+
+
+class ScraperTask(QtCore.QRunnable):
+    """Runs one scrape on Qt's global thread pool, reporting through the window's signals."""
+
+    def __init__(self, window: "ScraperGUI", config: Dict[str, Any]) -> None:
+        super().__init__()
+        self._window = window
+        self._config = config
+
+    def run(self) -> None:
+        self._window.run_scraper_thread(self._config)
 
 
 class ScraperGUI(QtWidgets.QWidget):
     """Main application window combining the view and controller roles."""
 
+    # Worker log lines are buffered and appended in one batch per interval.
+    LOG_FLUSH_INTERVAL_MS = 100
+
     log_signal = QtCore.pyqtSignal(str)
     scraping_complete = QtCore.pyqtSignal()
 
@@ -28,7 +43,15 @@ class ScraperGUI(QtWidgets.QWidget):
         self.resize(800, 600)
 
         self.config_path = Path(__file__).resolve().parent / "config.json"
-        self._scraper_thread: threading.Thread | None = None
+        self._active_scraper: Optional[Scraper] = None
+        # (mtime_ns, parsed config) so repeated runs skip re-reading an unchanged file.
+        self._config_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+        self._log_buffer: Deque[str] = deque()
+        self._log_mutex = QtCore.QMutex()
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setInterval(self.LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_log_buffer)
 
         self.log_signal.connect(self._append_log)
         self.scraping_complete.connect(self._on_scraping_complete)
@@ -63,23 +86,29 @@ class ScraperGUI(QtWidgets.QWidget):
 
     def _load_config(self) -> Dict[str, Any]:
         try:
-            raw = self.config_path.read_text(encoding="utf-8")
-            return json.loads(raw)
+            mtime_ns = self.config_path.stat().st_mtime_ns
         except FileNotFoundError:
-            raise ConfigError(f"Configuration file not found: {self.config_path}")
-        except json.JSONDecodeError as exc:
-            raise ConfigError(f"Invalid JSON in configuration file: {exc}") from exc
+            raise ConfigError(f"Configuration file not found: {self.config_path}") from None
+
+        if self._config_cache is None or self._config_cache[0] != mtime_ns:
+            self._config_cache = (mtime_ns, load_config(self.config_path))
+        return self._config_cache[1]
 
     # ------------------------------------------------------------------
     # Event handlers
     # ------------------------------------------------------------------
     def start_scraping(self) -> None:
         self.log_output.clear()
-        self.start_button.setEnabled(False)
+        try:
+            config = self._load_config()
+        except ConfigError as exc:
+            self.log_signal.emit(str(exc))
+            return
 
+        self.start_button.setEnabled(False)
         self.log_signal.emit("Starting scraper in a background thread...")
-        self._scraper_thread = threading.Thread(target=self.run_scraper_thread, daemon=True, name="ScraperThread")
-        self._scraper_thread.start()
+        self._log_timer.start()
+        QtCore.QThreadPool.globalInstance().start(ScraperTask(self, dict(config)))
 
     def open_config_file(self) -> None:
         try:
@@ -92,31 +121,55 @@ class ScraperGUI(QtWidgets.QWidget):
         except Exception as exc:
             self.log_signal.emit(f"Unable to open config file: {exc}")
 
-    def run_scraper_thread(self) -> None:
+    def run_scraper_thread(self, config: Dict[str, Any]) -> None:
         try:
-            scraper = Scraper(self.config_path, status_callback=self.log_signal.emit)
-            results = scraper.run()
-            if results:
+            scraper = Scraper(self.config_path, status_callback=self.queue_log, config=config)
+            self._active_scraper = scraper
+            saved = scraper.run()
+            if saved:
                 summary = self._summarize_output(scraper)
-                self.log_signal.emit(summary)
+                self.queue_log(summary)
             else:
-                self.log_signal.emit("Scraper finished without collecting any data. Check your selectors and URLs.")
+                self.queue_log("Scraper finished without collecting any data. Check your selectors and URLs.")
         except (ConfigError, LoginError, ScraperError) as exc:
-            self.log_signal.emit(f"Scraper error: {exc}")
+            self.queue_log(f"Scraper error: {exc}")
         except Exception as exc:
-            self.log_signal.emit(f"Unexpected error: {exc}")
+            self.queue_log(f"Unexpected error: {exc}")
         finally:
+            self._active_scraper = None
             self.scraping_complete.emit()
 
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # noqa: N802 (Qt override)
+        # The application waits for pool threads on exit, so let an active scrape wind down.
+        scraper = self._active_scraper
+        if scraper is not None:
+            scraper.stop()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # Thread-safe UI helpers
     # ------------------------------------------------------------------
+    def queue_log(self, message: str) -> None:
+        """Buffer a log line from any thread; the GUI thread appends it on the next flush."""
+        with QtCore.QMutexLocker(self._log_mutex):
+            self._log_buffer.append(message)
+
+    @pyqtSlot()
+    def _flush_log_buffer(self) -> None:
+        with QtCore.QMutexLocker(self._log_mutex):
+            batch = list(self._log_buffer)
+            self._log_buffer.clear()
+        if batch:
+            self.log_output.append("\n".join(batch))
+
     @pyqtSlot(str)
     def _append_log(self, message: str) -> None:
         self.log_output.append(message)
 
     @pyqtSlot()
     def _on_scraping_complete(self) -> None:
+        self._log_timer.stop()
+        self._flush_log_buffer()
         self.start_button.setEnabled(True)
 
     # ------------------------------------------------------------------
@@ -148,22 +201,28 @@ class ScraperGUI(QtWidgets.QWidget):
 
         return f"Scraping complete. Output file saved to {output_path}."
 
+    # Previews only read the head of the output so they stay instant on very large files.
     def _preview_text_file(self, path: Path, max_lines: int = 10) -> str:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        with path.open("r", encoding="utf-8") as text_file:
+            lines = [line.rstrip("\r\n") for line in islice(text_file, max_lines + 1)]
         preview_lines = lines[:max_lines]
         if len(lines) > max_lines:
             preview_lines.append("...")
         return "\n".join(preview_lines) if preview_lines else "(file is empty)"
 
-    def _preview_json(self, path: Path) -> str:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        pretty = json.dumps(data, ensure_ascii=False, indent=2)
-        return pretty if len(pretty) <= 2000 else pretty[:2000] + "\n..."
+    def _preview_json(self, path: Path, max_chars: int = 2000) -> str:
+        # The scraper writes indented JSON, so the start of the file is already readable.
+        with path.open("rb") as json_file:
+            head = json_file.read(max_chars + 1)
+        # Dropping "ignore"d bytes only trims a multi-byte character cut off at the end.
+        preview = head[:max_chars].decode("utf-8", errors="ignore")
+        return preview if len(head) <= max_chars else preview + "\n..."
 
     def _count_sqlite_rows(self, path: Path) -> int:
         connection = sqlite3.connect(path)
         try:
             cursor = connection.cursor()
+            # The scraper's unique url index covers this count, so the page bodies are not read.
             cursor.execute("SELECT COUNT(*) FROM scraped_data")
             (count,) = cursor.fetchone() or (0,)
             return int(count)
@@ -1,19 +1,182 @@
 ﻿"""Scraper module for the configurable web scraping application."""
 from __future__ import annotations
 
+import asyncio
+import codecs
 import csv
 import json
+import multiprocessing
+import queue
+import re
 import sqlite3
+import threading
 import time
-from datetime import datetime, timezone
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional
-from urllib.parse import urljoin
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import urljoin, urlsplit
 
 import requests
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag, UnicodeDammit
+from bs4.builder import builder_registry
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # Optional dependency used only by Scraper.run_async.
+    aiohttp = None  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library encoder.
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the C-based lxml tree builder when it is installed.
+try:
+    import lxml  # noqa: F401
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    _HTML_PARSER = "html.parser"
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Optional dependency used only when html_parser is "selectolax".
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+
+# html_parser value that routes parsed captures through selectolax's Lexbor engine.
+_SELECTOLAX = "selectolax"
 
 StatusCallback = Optional[Callable[[str], None]]
+ParsedSelectors = Tuple[soupsieve.SoupSieve, soupsieve.SoupSieve, soupsieve.SoupSieve]
+Selector = Union[str, soupsieve.SoupSieve]
+
+# Large file buffer so CSV/JSON output is flushed in a few big writes instead of many small ones.
+_WRITE_BUFFER_SIZE = 1 << 20
+# Default rows written to the output sink per batch (one SQLite transaction, one
+# buffered file write); overridden by the "flush_every" config key.
+_SINK_BATCH_SIZE = 1024
+# Scraped rows waiting for the writer thread; workers block once it falls this far behind.
+_SINK_QUEUE_SIZE = 2048
+# A partial batch is written once its oldest row has waited this many seconds.
+_SINK_FLUSH_INTERVAL = 1.0
+_SINK_CLOSED = object()
+_SQLITE_TABLE = "scraped_data"
+# A single tag-qualified compound selector such as div.question, li#a or img[src].
+_SIMPLE_SELECTOR = re.compile(r"^([A-Za-z][\w-]*)(?:[.#][\w-]+|\[[^\[\]]*\])*$")
+_TABLE_CELL_NAMES = ("th", "td")
+
+
+def _declared_charset(content_type: Optional[str]) -> Optional[str]:
+    """Return the charset parameter of a Content-Type header, if the server sent one."""
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            return value.strip().strip("'\"") or None
+    return None
+
+
+def _decode_html(content: bytes, encoding: Optional[str]) -> str:
+    """Decode a response body, preferring the declared charset and sniffing ``<meta>`` otherwise."""
+    if encoding:
+        try:
+            return content.decode(encoding, errors="replace")
+        except LookupError:
+            pass
+    markup = UnicodeDammit(content, is_html=True).unicode_markup
+    return markup if markup is not None else content.decode("utf-8", errors="replace")
+
+
+def _is_utf8(encoding: Optional[str]) -> bool:
+    if not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as ISO 8601 with microseconds and a ``Z`` suffix."""
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanoseconds // 1000:06d}Z"
+
+
+# Element helpers accepting either a BeautifulSoup tag or a selectolax node, so the
+# capture code is shared by both parser backends.
+def _select(root: Any, selector: Selector) -> List[Any]:
+    if isinstance(root, Tag):
+        return root.select(selector) if isinstance(selector, str) else selector.select(root)
+    return root.css(selector if isinstance(selector, str) else selector.pattern)
+
+
+def _select_one(root: Any, selector: Selector) -> Optional[Any]:
+    if isinstance(root, Tag):
+        return root.select_one(selector) if isinstance(selector, str) else selector.select_one(root)
+    return root.css_first(selector if isinstance(selector, str) else selector.pattern)
+
+
+def _tag_text(tag: Tag) -> str:
+    # Most answers and table cells hold a single text node; stripping it directly skips
+    # get_text's generator walk over the subtree.
+    contents = tag.contents
+    if len(contents) == 1 and type(contents[0]) is NavigableString:
+        return contents[0].strip()
+    return tag.get_text(strip=True)
+
+
+def _node_text(node: Any) -> str:
+    if isinstance(node, Tag):
+        return _tag_text(node)
+    return node.text(strip=True)
+
+
+def _node_attr(node: Any, name: str) -> Optional[str]:
+    value = node.get(name) if isinstance(node, Tag) else node.attributes.get(name)
+    return value if isinstance(value, str) else None
+
+
+def _tree_text(tree: Any) -> str:
+    """Return the visible text of a BeautifulSoup or selectolax tree, one fragment per line.
+
+    A selectolax tree loses its ``<script>`` and ``<style>`` elements in the process.
+    """
+    if isinstance(tree, Tag):
+        return tree.get_text(separator="\n", strip=True)
+    # Lexbor's text() would include script and style bodies, which BeautifulSoup skips.
+    tree.strip_tags(["script", "style"])
+    return tree.root.text(separator="\n", strip=True, skip_empty=True)
+
+
+def _json_loads(raw: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# OPT_NON_STR_KEYS mirrors the standard library, which stringifies int/float/bool keys
+# rather than rejecting them.
+def _json_dumps(value: Any) -> str:
+    """Serialise ``value`` to compact, non-ASCII-escaped JSON text."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    # Compact separators match orjson, so cell values do not depend on which is installed.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_dumps_pretty(value: Any) -> bytes:
+    """Serialise ``value`` to UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
 
 
 class ScraperError(Exception):
@@ -32,17 +195,462 @@ class ScrapeError(ScraperError):
     """Raised when scraping an individual page fails."""
 
 
+def load_config(config_file: str | Path) -> Dict[str, Any]:
+    """Read and parse a JSON configuration file."""
+    config_path = Path(config_file)
+    try:
+        # utf-8-sig tolerates the byte-order mark some Windows editors add.
+        raw = config_path.read_text(encoding="utf-8-sig")
+    except FileNotFoundError:
+        raise ConfigError(f"Configuration file not found: {config_path}") from None
+    try:
+        return _json_loads(raw)
+    except json.JSONDecodeError as exc:  # orjson.JSONDecodeError subclasses this.
+        raise ConfigError(f"Failed to parse JSON configuration: {exc}") from exc
+
+
+class _OutputSink(ABC):
+    """Writes scraped rows to one output file, batch by batch.
+
+    The file is opened lazily on the first non-empty batch, so a run that
+    collects nothing leaves no empty output behind. Column-based sinks take
+    their columns from ``schema_fields`` when given instead of from the rows.
+    """
+
+    def __init__(
+        self, output_path: Path, schema_fields: Optional[List[str]] = None, status_callback: StatusCallback = None
+    ) -> None:
+        self.output_path = output_path
+        self.rows_written = 0
+        self._schema_fields = schema_fields
+        self._status_callback = status_callback
+
+    def append(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        self._write(rows)
+        self.rows_written += len(rows)
+
+    @abstractmethod
+    def close(self) -> None:
+        """Finish the output file and release it."""
+
+    def _emit_status(self, message: str) -> None:
+        if self._status_callback:
+            self._status_callback(message)
+
+    @abstractmethod
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """Write one non-empty batch of rows."""
+
+
+class _CsvSink(_OutputSink):
+    def __init__(
+        self, output_path: Path, schema_fields: Optional[List[str]] = None, status_callback: StatusCallback = None
+    ) -> None:
+        super().__init__(output_path, schema_fields, status_callback)
+        self._file: Optional[IO[str]] = None
+        self._writer: Any = None
+        self._fieldnames: List[str] = []
+        # Columns plus fields already reported as dropped, so each is reported once.
+        self._seen_fields: Set[str] = set()
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self._writer is None:
+            # Columns are fixed by the schema or the first batch; later keys outside it are dropped.
+            self._fieldnames = self._schema_fields or _collect_fieldnames(rows)
+            self._seen_fields = set(self._fieldnames)
+            self._file = self.output_path.open("w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE)
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self._fieldnames)
+        elif self._schema_fields is None:
+            new_fields = [name for name in _collect_fieldnames(rows) if name not in self._seen_fields]
+            if new_fields:
+                # The header is already written, so fields first seen now cannot get a column.
+                self._seen_fields.update(new_fields)
+                self._emit_status(
+                    f"CSV columns were fixed by the first batch; leaving out new fields: {', '.join(new_fields)}"
+                )
+        # Plain lists in column order skip DictWriter's per-row dict rebuild; list and
+        # dict values (answers, tables, images) become JSON strings in _coerce_for_csv.
+        fieldnames = self._fieldnames
+        self._writer.writerows([_coerce_for_csv(row.get(field)) for field in fieldnames] for row in rows)
+        # Each batch reaches the file, so the sink's age-based flush bounds what a crash loses.
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class _JsonSink(_OutputSink):
+    """Streams rows into a single indented JSON array, matching a one-shot ``indent=2`` dump."""
+
+    def __init__(
+        self, output_path: Path, schema_fields: Optional[List[str]] = None, status_callback: StatusCallback = None
+    ) -> None:
+        super().__init__(output_path, schema_fields, status_callback)
+        self._file: Optional[IO[bytes]] = None
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self._file is None:
+            self._file = self.output_path.open("wb", buffering=_WRITE_BUFFER_SIZE)
+            self._file.write(b"[")
+        for index, row in enumerate(rows):
+            separator = b"\n  " if self.rows_written == 0 and index == 0 else b",\n  "
+            self._file.write(separator + _json_dumps_pretty(row).replace(b"\n", b"\n  "))
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.write(b"\n]")
+            self._file.close()
+            self._file = None
+
+
+class _SqliteSink(_OutputSink):
+    def __init__(
+        self, output_path: Path, schema_fields: Optional[List[str]] = None, status_callback: StatusCallback = None
+    ) -> None:
+        super().__init__(output_path, schema_fields, status_callback)
+        self._connection: Optional[sqlite3.Connection] = None
+        self._insert_sql = ""
+        self._fieldnames: List[str] = []
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        if self._connection is None:
+            # The insert statement is built from the schema or first batch and reused until a
+            # batch brings new fields; a configured schema never changes.
+            self._fieldnames = list(self._schema_fields or _collect_fieldnames(rows))
+            self._connection = self._connect(self.output_path)
+            self._prepare_table(self._connection, self._fieldnames)
+            self._insert_sql = self._build_insert_sql(self._fieldnames)
+        elif self._schema_fields is None:
+            known = set(self._fieldnames)
+            new_fields = [name for name in _collect_fieldnames(rows) if name not in known]
+            if new_fields:
+                self._add_columns(self._connection, new_fields)
+                self._fieldnames.extend(new_fields)
+                self._insert_sql = self._build_insert_sql(self._fieldnames)
+        values = (tuple(_coerce_for_sqlite(row.get(field)) for field in self._fieldnames) for row in rows)
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN")
+        try:
+            cursor.executemany(self._insert_sql, values)
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    @staticmethod
+    def _connect(output_path: Path) -> sqlite3.Connection:
+        # Autocommit mode so each batch is written in one explicit transaction.
+        connection = sqlite3.connect(output_path, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        # 64 MiB page cache (negative values are KiB) keeps the url index hot across batches.
+        connection.execute("PRAGMA cache_size=-65536")
+        return connection
+
+    @staticmethod
+    def _prepare_table(connection: sqlite3.Connection, fieldnames: List[str]) -> None:
+        """Create the output table if needed and add any of ``fieldnames`` it lacks.
+
+        URLs are unique, so re-running a scrape into the same database skips pages
+        that were already stored instead of writing their content a second time.
+        """
+        columns_sql = ",\n".join(f'"{name}" TEXT' for name in fieldnames)
+        connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {_SQLITE_TABLE} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {columns_sql}
+            )
+            """
+        )
+        existing = {row[1] for row in connection.execute(f"PRAGMA table_info({_SQLITE_TABLE})")}
+        _SqliteSink._add_columns(connection, [name for name in fieldnames if name not in existing])
+        if "url" in fieldnames:
+            # An index rather than a table constraint also covers tables written by older versions.
+            try:
+                connection.execute(
+                    f'CREATE UNIQUE INDEX IF NOT EXISTS {_SQLITE_TABLE}_url ON {_SQLITE_TABLE} ("url")'
+                )
+            except sqlite3.IntegrityError:
+                pass  # The table already holds duplicate URLs; keep appending as before.
+
+    @staticmethod
+    def _add_columns(connection: sqlite3.Connection, fieldnames: List[str]) -> None:
+        for name in fieldnames:
+            connection.execute(f'ALTER TABLE {_SQLITE_TABLE} ADD COLUMN "{name}" TEXT')
+
+    @staticmethod
+    def _build_insert_sql(fieldnames: List[str]) -> str:
+        placeholders = ", ".join("?" for _ in fieldnames)
+        column_list = ", ".join(f'"{name}"' for name in fieldnames)
+        return f"INSERT OR IGNORE INTO {_SQLITE_TABLE} ({column_list}) VALUES ({placeholders})"
+
+
+_SINK_TYPES = {"csv": _CsvSink, "json": _JsonSink, "sqlite": _SqliteSink}
+
+
+def _collect_fieldnames(data: List[Dict[str, Any]]) -> List[str]:
+    # A dict doubles as an insertion-ordered set with O(1) membership checks; keys
+    # are set directly rather than through a throwaway dict.fromkeys() per row.
+    fieldnames: Dict[str, None] = {}
+    for row in data:
+        for key in row:
+            fieldnames[key] = None
+    fieldnames.setdefault("tables", None)
+    fieldnames.setdefault("images", None)
+    return list(fieldnames)
+
+
+def _json_field(value: Union[list, dict]) -> str:
+    # Pages without tables or images are common, so empty values skip the encoder call.
+    if not value:
+        return "[]" if isinstance(value, list) else "{}"
+    return _json_dumps(value)
+
+
+def _coerce_for_csv(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return _json_field(value)
+    return value
+
+
+def _coerce_for_sqlite(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return _json_field(value)
+    return value
+
+
+def _batched(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _join_patterns(selectors: List[soupsieve.SoupSieve]) -> str:
+    return ", ".join(selector.pattern for selector in selectors)
+
+
+class _MediaExtractor:
+    """Collects the tables and images matched by ``table_selectors`` and ``image_selectors``.
+
+    Kept at module level and picklable so raw-mode worker processes can run it on
+    the tree they already built for ``raw_text``.
+    """
+
+    def __init__(self, table_selectors: List[soupsieve.SoupSieve], image_selectors: List[soupsieve.SoupSieve]) -> None:
+        self.table_selectors = table_selectors
+        self.image_selectors = image_selectors
+        # Union of both lists so a BeautifulSoup tree is walked once for tables and images.
+        self._union: Optional[soupsieve.SoupSieve] = None
+        if table_selectors or image_selectors:
+            self._union = soupsieve.compile(_join_patterns(table_selectors + image_selectors))
+        # Matches from the union can be routed by tag name only when no image selector
+        # can match a <table> and no table selector can match an <img>.
+        self._by_tag = self._selectors_only_match(table_selectors, "table") and (
+            self._selectors_only_match(image_selectors, "img")
+        )
+
+    def __bool__(self) -> bool:
+        return self._union is not None
+
+    def extract(self, soup: Any, base_url: str) -> Tuple[List[List[List[str]]], List[str]]:
+        tables: List[List[List[str]]] = []
+        images: List[str] = []
+        # Set membership keeps de-duplication linear on galleries with many repeated images.
+        seen_images = set()
+        for element, is_table, is_image in self._matches(soup):
+            if is_table:
+                parsed_table = self._parse_html_table(element)
+                if parsed_table:
+                    tables.append(parsed_table)
+            if is_image:
+                src = _node_attr(element, "src")
+                if not src:
+                    continue
+                absolute_url = urljoin(base_url, src)
+                if absolute_url not in seen_images:
+                    seen_images.add(absolute_url)
+                    images.append(absolute_url)
+        return tables, images
+
+    def _matches(self, soup: Any) -> Iterator[Tuple[Any, bool, bool]]:
+        """Yield ``(element, is_table, is_image)`` for every table/image selector match.
+
+        Both backends walk the tree once with the union selector, so every element
+        is reported once and in document order whichever parser built the tree.
+        """
+        if self._union is None:
+            return iter(())
+        if not isinstance(soup, Tag):
+            return self._lexbor_matches(soup)
+        return ((element, *self._kind(element)) for element in self._union.select(soup))
+
+    def _lexbor_matches(self, tree: Any) -> Iterator[Tuple[Any, bool, bool]]:
+        # Lexbor also returns union matches in document order, but once per matching
+        # selector, so repeats are skipped. Nodes are identified by their C pointer.
+        table_ids = image_ids = None
+        if self.table_selectors and self.image_selectors and not self._by_tag:
+            table_ids = {node.mem_id for node in tree.css(_join_patterns(self.table_selectors))}
+            image_ids = {node.mem_id for node in tree.css(_join_patterns(self.image_selectors))}
+        seen = set()
+        for node in tree.css(self._union.pattern):
+            node_id = node.mem_id
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            if table_ids is not None and image_ids is not None:
+                yield node, node_id in table_ids, node_id in image_ids
+            elif not self.image_selectors:
+                yield node, True, False
+            elif not self.table_selectors:
+                yield node, False, True
+            else:
+                yield node, node.tag == "table", node.tag == "img"
+
+    def _kind(self, element: Tag) -> Tuple[bool, bool]:
+        if not self.image_selectors:
+            return True, False
+        if not self.table_selectors:
+            return False, True
+        # Each selector.match() call costs about as much as the walk saved, so the
+        # tag name decides whenever that is known to give the same answer.
+        if self._by_tag:
+            return element.name == "table", element.name == "img"
+        return (
+            any(selector.match(element) for selector in self.table_selectors),
+            any(selector.match(element) for selector in self.image_selectors),
+        )
+
+    @staticmethod
+    def _selectors_only_match(selectors: List[soupsieve.SoupSieve], name: str) -> bool:
+        """Return whether every selector can only match ``name`` elements.
+
+        The check is conservative: each comma-separated part must end in a compound
+        qualified by ``name``, and anything with pseudo-classes or quoting is rejected.
+        """
+        for selector in selectors:
+            pattern = selector.pattern
+            if any(char in pattern for char in "():\\\"'"):
+                return False
+            for part in pattern.split(","):
+                subject = re.split(r"[\s>+~]+", part.strip())[-1]
+                match = _SIMPLE_SELECTOR.match(subject)
+                if match is None or match.group(1).lower() != name:
+                    return False
+        return True
+
+    @staticmethod
+    def _parse_html_table(table: Any) -> List[List[str]]:
+        # One loop per backend so cells skip the per-node dispatch in _node_text.
+        if not isinstance(table, Tag):
+            lexbor_rows = ([cell.text(strip=True) for cell in row.css("th, td")] for row in table.css("tr"))
+            return [cells for cells in lexbor_rows if cells]
+        rows: List[List[str]] = []
+        rows_append = rows.append
+        for row in table.find_all("tr"):
+            # Filtering .descendants by name matches find_all(("th", "td")) without building
+            # a new bs4 filter object for every row.
+            cells = [_tag_text(cell) for cell in row.descendants if cell.name in _TABLE_CELL_NAMES]
+            if cells:
+                rows_append(cells)
+        return rows
+
+
+# Set in each raw-mode worker process by _init_raw_worker: (parser, include_text, media).
+_raw_worker_settings: Optional[Tuple[str, bool, _MediaExtractor]] = None
+
+
+def _init_raw_worker(parser: str, include_text: bool, media: _MediaExtractor) -> None:
+    global _raw_worker_settings
+    _raw_worker_settings = (parser, include_text, media)
+
+
+def _extract_raw_page(html: str, base_url: str) -> Tuple[Optional[str], List[List[List[str]]], List[str]]:
+    """Parse ``html`` once in a worker process and return its text, tables and images."""
+    assert _raw_worker_settings is not None, "worker not initialised"
+    parser, include_text, media = _raw_worker_settings
+    tree = LexborHTMLParser(html) if parser == _SELECTOLAX else BeautifulSoup(html, parser)
+    # Media first: Lexbor's text extraction strips <script> and <style> from the tree.
+    tables, images = media.extract(tree, base_url)
+    return (_tree_text(tree) if include_text else None), tables, images
+
+
 class Scraper:
     """Core scraping engine driven entirely by an external JSON config."""
 
-    def __init__(self, config_file: str | Path, status_callback: StatusCallback = None) -> None:
+    def __init__(
+        self,
+        config_file: str | Path,
+        status_callback: StatusCallback = None,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Create a scraper for ``config_file``.
+
+        Pass ``config`` when the file has already been parsed (e.g. by the GUI) to
+        skip reading it again; ``config_file`` still anchors the output path.
+        """
         self.config_path = Path(config_file)
         self.status_callback = status_callback
         self.session = requests.Session()
         self.config: Dict[str, Any] = {}
-        self._emit_status(f"Loading configuration from {self.config_path}...")
-        self._load_config()
+        self._status_lock = threading.Lock()
+        self._rate_lock = threading.Lock()
+        # Earliest monotonic time the next request to each host may start.
+        self._next_request_at: Dict[str, float] = {}
+        self._stop_event = threading.Event()
+        # Loop and event of a running run_async, so stop() can wake its rate-limit waits.
+        self._async_stop: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = None
+        self._text_executor: Optional[ProcessPoolExecutor] = None
+        self._sink: Optional[_OutputSink] = None
+        self._sink_queue: Optional[queue.Queue] = None
+        self._sink_thread: Optional[threading.Thread] = None
+        self._sink_error: Optional[Exception] = None
+        if config is None:
+            self._emit_status(f"Loading configuration from {self.config_path}...")
+            config = load_config(self.config_path)
+        self.config = config
+        # Settings read on every page or run are resolved once here; max_workers also
+        # sizes the connection pool in _apply_session_overrides.
+        self._max_workers = self._get_int_setting("max_workers", 8, 1)
         self._apply_session_overrides()
+        self._capture_mode = self._get_capture_mode()
+        self._rate_limit_delay = self._get_int_setting("rate_limit_delay", 1, 0)
+        self._flush_every = self._get_int_setting("flush_every", _SINK_BATCH_SIZE, 1)
+        self._raw_text_processes = self._get_int_setting("raw_text_processes", 0, 0)
+        self._raw_include_text = bool(self.config.get("raw_include_text", True))
+        self._sink_type = self._get_sink_type()
+        self._schema_fields = self._get_schema_fields()
+        self._html_parser = self._get_html_parser()
+        self._parsed_selectors: Optional[ParsedSelectors] = None
+        if self._capture_mode == "parsed":
+            self._parsed_selectors = self._compile_parsed_selectors()
+        self._table_selectors = self._compile_selector_list("table_selectors")
+        self._image_selectors = self._compile_selector_list("image_selectors")
+        self._media = _MediaExtractor(self._table_selectors, self._image_selectors)
+        self._parse_only: Optional[SoupStrainer] = None
+        if self._parsed_selectors is not None and self._html_parser != _SELECTOLAX:
+            self._parse_only = self._build_strainer(
+                [*self._parsed_selectors, *self._table_selectors, *self._image_selectors]
+            )
 
     # ------------------------------------------------------------------
     # Public API
@@ -87,111 +695,332 @@ class Scraper:
 
         self._emit_status("Login completed (verification pending website-specific checks).")
 
+    def stop(self) -> None:
+        """Ask a running scrape to wind down; pages not yet fetched are skipped.
+
+        Safe to call from any thread. Results collected so far are still saved.
+        """
+        self._stop_event.set()
+        async_stop = self._async_stop
+        if async_stop is not None:
+            loop, stop_requested = async_stop
+            try:
+                loop.call_soon_threadsafe(stop_requested.set)
+            except RuntimeError:
+                pass  # The run finished and closed its loop in the meantime.
+
     def scrape_page(self, url: str) -> Optional[Dict[str, Any]]:
         """Scrape a single page and return the extracted data dictionary."""
-        delay = max(int(self.config.get("rate_limit_delay", 1)), 0)
-        if delay:
-            time.sleep(delay)
+        if self._stop_event.is_set():
+            return None
+        self._wait_for_rate_limit(url)
+        if self._stop_event.is_set():
+            return None
 
         self._emit_status(f"Fetching {url}...")
         try:
-            response = self.session.get(url, timeout=20)
-            response.raise_for_status()
+            # Streaming defers the body download until raise_for_status has passed, and the
+            # page is handled as bytes so it is only decoded where text is actually needed.
+            with self.session.get(url, timeout=20, stream=True) as response:
+                response.raise_for_status()
+                content = response.content
+                status_code = response.status_code
+                encoding = _declared_charset(response.headers.get("Content-Type"))
         except requests.RequestException as exc:
             self._emit_status(f"Network error while fetching {url}: {exc}")
             return None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        capture_mode = self._get_capture_mode()
-
-        try:
-            if capture_mode == "raw":
-                data = self._capture_raw(url, response, soup)
-            else:
-                data = self._capture_parsed(url, soup)
+        return self._process_page(url, status_code, content, encoding)
 
-            tables = self._extract_tables(soup)
-            if tables:
-                data["tables"] = tables
+    def save_data(self, data: Iterable[Dict[str, Any]]) -> Path:
+        """Persist scraped data using the configured output format.
 
-            images = self._extract_images(soup, url)
-            if images:
-                data["images"] = images
+        ``data`` may be any iterable, including a generator; rows are written in
+        batches so the full result set never has to be held in memory.
+        """
+        sink = self._create_sink()
+        try:
+            for batch in _batched(data, self._flush_every):
+                sink.append(batch)
+        finally:
+            sink.close()
+        if not sink.rows_written:
+            raise ScraperError("No data was scraped; nothing to save.")
 
-            self._emit_status(f"Successfully scraped {url}.")
-            return data
-        except ScrapeError as exc:
-            self._emit_status(f"Parsing error for {url}: {exc}")
+        self._emit_status(f"Data saved to {sink.output_path}")
+        return sink.output_path
+
+    def open_sink(self) -> None:
+        """Start writing results incrementally instead of in one ``save_data`` call.
+
+        Rows passed to :meth:`append` are handed to a background writer thread that
+        saves them in batches, so memory stays flat however many pages are scraped
+        and a long run keeps what it has collected even if it is interrupted.
+        """
+        if self._sink is not None:
+            raise ScraperError("An output sink is already open.")
+        self._sink = self._create_sink()
+        self._sink_queue = queue.Queue(maxsize=_SINK_QUEUE_SIZE)
+        self._sink_error = None
+        self._sink_thread = threading.Thread(
+            target=self._drain_sink_queue,
+            args=(self._sink, self._sink_queue, self._flush_every),
+            name="ScraperWriter",
+            daemon=True,
+        )
+        self._sink_thread.start()
+
+    def append(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Queue rows for the open sink; blocks while the writer is a full queue behind."""
+        if self._sink_queue is None:
+            raise ScraperError("No output sink is open; call open_sink() first.")
+        for row in rows:
+            self._sink_queue.put(row)
+
+    def close_sink(self) -> Optional[Path]:
+        """Write any queued rows and close the sink; returns the path if anything was saved."""
+        if self._sink is None or self._sink_queue is None or self._sink_thread is None:
             return None
-        except Exception as exc:  # Catch unexpected parsing edge cases.
-            self._emit_status(f"Unexpected parsing error for {url}: {exc}")
+        sink = self._sink
+        try:
+            self._sink_queue.put(_SINK_CLOSED)
+            self._sink_thread.join()
+        finally:
+            self._sink = None
+            self._sink_queue = None
+            self._sink_thread = None
+        if self._sink_error is not None:
+            raise ScraperError(f"Failed to write {sink.output_path}: {self._sink_error}") from self._sink_error
+        if not sink.rows_written:
             return None
+        self._emit_status(f"Data saved to {sink.output_path}")
+        return sink.output_path
 
-    def save_data(self, data: Iterable[Dict[str, Any]]) -> Path:
-        """Persist scraped data using the configured output format."""
-        data_list = list(data)
-        if not data_list:
-            raise ScraperError("No data was scraped; nothing to save.")
-
-        output_format = (self.config.get("output_format") or "").lower()
-        output_filename = self._require_config_value("output_filename")
-        output_path = (self.config_path.parent / output_filename).resolve()
-
-        if output_format == "csv":
-            self._save_to_csv(data_list, output_path)
-        elif output_format == "json":
-            self._save_to_json(data_list, output_path)
-        elif output_format == "sqlite":
-            self._save_to_sqlite(data_list, output_path)
-        else:
-            raise ScraperError(f"Unsupported output format: {output_format}")
+    def run(self) -> int:
+        """Execute the full scraping workflow and return the number of pages saved.
 
-        self._emit_status(f"Data saved to {output_path}")
-        return output_path
+        With ``async_fetch`` enabled this drives :meth:`run_async` on a new event
+        loop; otherwise pages are fetched by a pool of worker threads.
+        """
+        if self.config.get("async_fetch", False):
+            return asyncio.run(self.run_async())
 
-    def run(self) -> List[Dict[str, Any]]:
-        """Execute the full scraping workflow."""
         self._emit_status("Starting scraping workflow...")
         self.login()
 
-        results: List[Dict[str, Any]] = []
-        for url in self.config.get("start_urls", []):
-            if not url:
-                continue
-            try:
-                page_data = self.scrape_page(url)
-                if page_data:
-                    results.append(page_data)
-            except Exception as exc:
-                self._emit_status(f"Unhandled error while scraping {url}: {exc}")
+        urls = self._get_start_urls()
+        saved = 0
+        self.open_sink()
+        try:
+            with self._raw_text_pool(), ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="ScraperWorker"
+            ) as executor:
+                futures = {executor.submit(self.scrape_page, url): url for url in urls}
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        page_data = future.result()
+                        if page_data:
+                            self.append([page_data])
+                            saved += 1
+                    except Exception as exc:
+                        self._emit_status(f"Unhandled error while scraping {url}: {exc}")
+        finally:
+            self.close_sink()
 
-        if not results:
-            self._emit_status("No successful scrapes were recorded.")
-            return []
+        return self._finish_run(saved)
 
+    async def run_async(self) -> int:
+        """Execute the full scraping workflow, fetching pages with aiohttp on an event loop."""
+        if aiohttp is None:
+            raise ScraperError("Asynchronous scraping requires the 'aiohttp' package (pip install aiohttp).")
+
+        self._emit_status("Starting scraping workflow (asyncio)...")
+        self.login()
+
+        urls = self._get_start_urls()
+        max_workers = self._max_workers
+        semaphore = asyncio.Semaphore(max_workers)
+        connector = aiohttp.TCPConnector(limit=max_workers, limit_per_host=max_workers)
+        # aiohttp negotiates its own transfer encoding and keep-alive behaviour.
+        headers = {
+            key: value
+            for key, value in self.session.headers.items()
+            if key.lower() not in {"accept-encoding", "connection"}
+        }
+        saved = 0
+        stop_requested = asyncio.Event()
+        self._async_stop = (asyncio.get_running_loop(), stop_requested)
+        if self._stop_event.is_set():
+            stop_requested.set()
+        self.open_sink()
         try:
-            self.save_data(results)
-        except ScraperError as exc:
-            self._emit_status(str(exc))
-            raise
+            with self._raw_text_pool():
+                async with aiohttp.ClientSession(
+                    headers=headers,
+                    cookie_jar=self._build_cookie_jar(),
+                    connector=connector,
+                    timeout=aiohttp.ClientTimeout(total=20),
+                ) as session:
+                    tasks = [
+                        asyncio.ensure_future(self._scrape_page_guarded(session, semaphore, stop_requested, url))
+                        for url in urls
+                    ]
+                    try:
+                        for next_result in asyncio.as_completed(tasks):
+                            data = await next_result
+                            if data:
+                                self.append([data])
+                                saved += 1
+                    finally:
+                        for task in tasks:
+                            task.cancel()
+                        await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._async_stop = None
+            self.close_sink()
 
-        self._emit_status("Scraping workflow completed.")
-        return results
+        return self._finish_run(saved)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _load_config(self) -> None:
-        if not self.config_path.exists():
-            raise ConfigError(f"Configuration file not found: {self.config_path}")
+    def _build_cookie_jar(self) -> Any:
+        """Copy the requests session cookies into an aiohttp jar, keeping their scope.
+
+        Cookies from ``session_cookies`` have no domain and go to every host, as with
+        requests; cookies set by a login response stay limited to their domain and path.
+        """
+        from yarl import URL  # Installed as an aiohttp dependency.
+
+        # unsafe=True keeps cookies scoped to IP-address hosts, which requests also sends.
+        jar = aiohttp.CookieJar(unsafe=True)
+        for cookie in self.session.cookies:
+            value = cookie.value or ""
+            if not cookie.domain:
+                jar.update_cookies({cookie.name: value})
+                continue
+            morsel = SimpleCookie()
+            morsel[cookie.name] = value
+            morsel[cookie.name]["path"] = cookie.path or "/"
+            if cookie.domain_specified:
+                morsel[cookie.name]["domain"] = cookie.domain
+            if cookie.secure:
+                morsel[cookie.name]["secure"] = True
+            scheme = "https" if cookie.secure else "http"
+            jar.update_cookies(morsel, response_url=URL.build(scheme=scheme, host=cookie.domain.lstrip(".")))
+        return jar
+
+    def _finish_run(self, saved: int) -> int:
+        if not saved:
+            self._emit_status("No successful scrapes were recorded.")
+            return 0
+
+        self._emit_status("Scraping workflow completed.")
+        return saved
+
+    def _create_sink(self) -> _OutputSink:
+        return self._sink_type(self._get_output_path(), self._schema_fields, self._emit_status)
+
+    def _drain_sink_queue(self, sink: _OutputSink, rows: queue.Queue, batch_size: int) -> None:
+        """Writer thread: batch queued rows into ``sink`` until the close marker arrives.
+
+        A batch is written once it holds ``batch_size`` rows or its first row is
+        ``_SINK_FLUSH_INTERVAL`` seconds old, so slow runs still reach disk promptly.
+        """
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+        try:
+            while True:
+                try:
+                    # Only wait with a timeout while holding rows; an empty batch has no deadline.
+                    row = rows.get(timeout=max(deadline - time.monotonic(), 0.0)) if batch else rows.get()
+                except queue.Empty:
+                    pass
+                else:
+                    if row is _SINK_CLOSED:
+                        break
+                    if not batch:
+                        deadline = time.monotonic() + _SINK_FLUSH_INTERVAL
+                    batch.append(row)
+                    if len(batch) < batch_size and time.monotonic() < deadline:
+                        continue
+                self._write_sink_batch(sink, batch)
+                batch = []
+            self._write_sink_batch(sink, batch)
+        finally:
+            try:
+                sink.close()
+            except Exception as exc:
+                self._sink_error = self._sink_error or exc
+
+    def _write_sink_batch(self, sink: _OutputSink, batch: List[Dict[str, Any]]) -> None:
+        # After a failure keep draining so producers never block on a dead writer.
+        if self._sink_error is not None:
+            return
+        try:
+            sink.append(batch)
+        except Exception as exc:
+            self._sink_error = exc
+
+    def _process_page(
+        self, url: str, status_code: int, content: bytes, encoding: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a fetched page into the data dictionary for the active capture mode.
+
+        ``encoding`` is the charset declared by the server, or ``None`` to detect it.
+        """
         try:
-            raw = self.config_path.read_text(encoding="utf-8")
-            self.config = json.loads(raw)
-        except json.JSONDecodeError as exc:
-            raise ConfigError(f"Failed to parse JSON configuration: {exc}") from exc
+            # A BeautifulSoup document, or a Lexbor tree when html_parser is "selectolax".
+            soup: Optional[Any]
+            if self._capture_mode == "raw":
+                # raw_html needs the decoded text anyway; only build a tree when something will read it.
+                html = _decode_html(content, encoding)
+                soup = self._parse_tree(html) if self._raw_needs_soup() else None
+                data = self._capture_raw(url, status_code, html, soup)
+            else:
+                if self._html_parser == _SELECTOLAX:
+                    # Lexbor parses UTF-8 bytes natively; decoding first would only be re-encoded.
+                    soup = LexborHTMLParser(content if _is_utf8(encoding) else _decode_html(content, encoding))
+                else:
+                    soup = BeautifulSoup(
+                        content, self._html_parser, from_encoding=encoding, parse_only=self._parse_only
+                    )
+                data = self._capture_parsed(url, soup)
+                self._add_media(data, *self._media.extract(soup, url))
+
+            self._emit_status(f"Successfully scraped {url}.")
+            return data
+        except ScrapeError as exc:
+            self._emit_status(f"Parsing error for {url}: {exc}")
+            return None
+        except Exception as exc:  # Catch unexpected parsing edge cases.
+            self._emit_status(f"Unexpected parsing error for {url}: {exc}")
+            return None
 
     def _apply_session_overrides(self) -> None:
         """Apply optional headers or cookies so existing browser sessions can be reused."""
+        # Size the keep-alive pool to the worker count so parallel fetches reuse
+        # connections instead of repeating TCP/TLS handshakes.
+        max_workers = self._max_workers
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers * 2,
+            # Transient server errors and throttling are retried with short backoff; the final
+            # response is returned so raise_for_status reports it. Retry-After is ignored
+            # because urllib3 sleeps for it (up to hours) where stop() cannot interrupt.
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset({"GET", "POST"}),
+                raise_on_status=False,
+                respect_retry_after_header=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         self.session.headers.setdefault(
             "User-Agent",
             (
@@ -216,6 +1045,132 @@ class Scraper:
                 self.session.cookies.set(str(key), str(value))
             self._emit_status("Applied session cookies from configuration.")
 
+    async def _scrape_page_guarded(
+        self, session: Any, semaphore: asyncio.Semaphore, stop_requested: asyncio.Event, url: str
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            return await self._scrape_page_async(session, semaphore, stop_requested, url)
+        except Exception as exc:
+            self._emit_status(f"Unhandled error while scraping {url}: {exc}")
+            return None
+
+    async def _scrape_page_async(
+        self, session: Any, semaphore: asyncio.Semaphore, stop_requested: asyncio.Event, url: str
+    ) -> Optional[Dict[str, Any]]:
+        if self._stop_event.is_set():
+            return None
+        wait = self._reserve_request_slot(url)
+        if wait > 0:
+            # Waiting on the event doubles as an interruptible sleep, as in _wait_for_rate_limit.
+            try:
+                await asyncio.wait_for(stop_requested.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+        try:
+            async with semaphore:
+                if self._stop_event.is_set():
+                    return None
+                self._emit_status(f"Fetching {url}...")
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    content = await response.read()
+                    status_code = response.status
+                    encoding = response.charset
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            self._emit_status(f"Network error while fetching {url}: {exc}")
+            return None
+
+        # Parsing is CPU-bound; keep it off the event loop so other fetches progress.
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._process_page, url, status_code, content, encoding)
+
+    def _get_start_urls(self) -> List[str]:
+        return [url for url in self.config.get("start_urls", []) if url]
+
+    def _get_int_setting(self, key: str, default: int, minimum: int) -> int:
+        """Read an integer setting, clamped to ``minimum``; invalid values fall back to ``default``."""
+        try:
+            return max(int(self.config.get(key, default)), minimum)
+        except (TypeError, ValueError):
+            self._emit_status(f"Invalid {key} value; defaulting to {default}.")
+            return default
+
+    @contextmanager
+    def _raw_text_pool(self) -> Iterator[None]:
+        """Parse raw-mode pages in worker processes for the duration of a scrape.
+
+        Tree building and ``get_text`` are pure Python and hold the GIL, so with
+        large pages the fetch threads would otherwise take turns on a single core.
+        Each page is parsed once, in the worker, for its text, tables and images.
+        """
+        processes = self._raw_text_processes
+        if (
+            not processes
+            or self._capture_mode != "raw"
+            or not (self._raw_include_text or self._media)
+        ):
+            yield
+            return
+
+        # Spawn rather than fork: the pool is started from worker threads (and next to Qt).
+        self._text_executor = ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_raw_worker,
+            initargs=(self._html_parser, self._raw_include_text, self._media),
+        )
+        try:
+            yield
+        finally:
+            self._text_executor.shutdown()
+            self._text_executor = None
+
+    def _wait_for_rate_limit(self, url: str) -> None:
+        wait = self._reserve_request_slot(url)
+        if wait > 0:
+            # Event.wait doubles as an interruptible sleep so stop() takes effect promptly.
+            self._stop_event.wait(wait)
+
+    def _reserve_request_slot(self, url: str) -> float:
+        """Book the next request slot for ``url``'s host and return how many seconds to wait.
+
+        Slots are spaced ``rate_limit_delay`` seconds apart per host across all
+        workers and coroutines, so each site is throttled while different hosts
+        are fetched in parallel.
+        """
+        delay = self._rate_limit_delay
+        if not delay:
+            return 0.0
+        host = urlsplit(url).netloc.lower()
+        with self._rate_lock:
+            now = time.monotonic()
+            scheduled = max(now, self._next_request_at.get(host, now))
+            self._next_request_at[host] = scheduled + delay
+        return scheduled - now
+
+    def _get_output_format(self) -> str:
+        return (self.config.get("output_format") or "").lower()
+
+    def _get_sink_type(self) -> type:
+        output_format = self._get_output_format()
+        sink_type = _SINK_TYPES.get(output_format)
+        if sink_type is None:
+            raise ConfigError(f"Unsupported output format: {output_format}")
+        return sink_type
+
+    def _get_schema_fields(self) -> Optional[List[str]]:
+        fields = self.config.get("schema_fields")
+        if fields is None:
+            return None
+        if not isinstance(fields, list) or not fields or not all(isinstance(name, str) and name for name in fields):
+            raise ConfigError("schema_fields must be a non-empty list of field names.")
+        return list(dict.fromkeys(fields))
+
+    def _get_output_path(self) -> Path:
+        output_filename = self._require_config_value("output_filename")
+        return (self.config_path.parent / output_filename).resolve()
+
     def _get_capture_mode(self) -> str:
         mode = str(self.config.get("capture_mode", "parsed")).lower()
         if mode not in {"parsed", "raw"}:
@@ -223,26 +1178,66 @@ class Scraper:
             return "parsed"
         return mode
 
-    def _capture_parsed(self, url: str, soup: BeautifulSoup) -> Dict[str, Any]:
-        question_selector = self._require_config_value("question_selector")
-        answer_selector = self._require_config_value("answer_selector")
-        explanation_selector = self._require_config_value("explanation_selector")
+    def _get_html_parser(self) -> str:
+        parser = str(self.config.get("html_parser") or _HTML_PARSER).lower()
+        if parser == _SELECTOLAX:
+            if LexborHTMLParser is not None:
+                return parser
+            self._emit_status(f"HTML parser '{parser}' requires the 'selectolax' package, using '{_HTML_PARSER}'.")
+            return _HTML_PARSER
+        if builder_registry.lookup(parser) is None:
+            self._emit_status(f"HTML parser '{parser}' is not available, using '{_HTML_PARSER}'.")
+            return _HTML_PARSER
+        return parser
+
+    def _compile_parsed_selectors(self) -> ParsedSelectors:
+        """Compile the parsed-mode selectors once so pages only pay for matching."""
+        return (
+            self._compile_selector("question_selector"),
+            self._compile_selector("answer_selector"),
+            self._compile_selector("explanation_selector"),
+        )
+
+    def _compile_selector(self, key: str) -> soupsieve.SoupSieve:
+        return self._compile_css(key, str(self._require_config_value(key)))
+
+    def _compile_selector_list(self, key: str) -> List[soupsieve.SoupSieve]:
+        return [self._compile_css(key, selector) for selector in self._get_selector_list(key)]
+
+    def _compile_css(self, key: str, selector: str) -> soupsieve.SoupSieve:
+        try:
+            compiled = soupsieve.compile(selector)
+        except soupsieve.SelectorSyntaxError as exc:
+            raise ConfigError(f"Invalid CSS selector for {key}: {exc}") from exc
+        if self._html_parser == _SELECTOLAX:
+            # Lexbor runs the pattern itself and lacks soupsieve extensions such as
+            # :-soup-contains() or :lang(), so it must accept the selector too.
+            try:
+                LexborHTMLParser("").css(selector)
+            except Exception as exc:  # SelectolaxError is not exported by every release.
+                raise ConfigError(f"CSS selector for {key} is not supported by selectolax: {exc}") from exc
+        return compiled
+
+    def _capture_parsed(self, url: str, soup: Any) -> Dict[str, Any]:
+        question_selector, answer_selector, explanation_selector = (
+            self._parsed_selectors or self._compile_parsed_selectors()
+        )
 
-        question_element = soup.select_one(question_selector)
+        question_element = _select_one(soup, question_selector)
         if not question_element:
-            raise ScrapeError(f"Question selector '{question_selector}' did not match any elements.")
+            raise ScrapeError(f"Question selector '{question_selector.pattern}' did not match any elements.")
 
-        answer_elements = soup.select(answer_selector)
+        answer_elements = _select(soup, answer_selector)
         if not answer_elements:
-            raise ScrapeError(f"Answer selector '{answer_selector}' did not match any elements.")
+            raise ScrapeError(f"Answer selector '{answer_selector.pattern}' did not match any elements.")
 
-        explanation_element = soup.select_one(explanation_selector)
+        explanation_element = _select_one(soup, explanation_selector)
         if not explanation_element:
-            raise ScrapeError(f"Explanation selector '{explanation_selector}' did not match any elements.")
+            raise ScrapeError(f"Explanation selector '{explanation_selector.pattern}' did not match any elements.")
 
-        answers: List[str] = [element.get_text(strip=True) for element in answer_elements]
-        question_text = question_element.get_text(strip=True)
-        explanation_text = explanation_element.get_text(strip=True)
+        answers: List[str] = [_node_text(element) for element in answer_elements]
+        question_text = _node_text(question_element)
+        explanation_text = _node_text(explanation_element)
 
         return {
             "url": url,
@@ -251,65 +1246,72 @@ class Scraper:
             "explanation": explanation_text,
         }
 
-    def _capture_raw(self, url: str, response: requests.Response, soup: BeautifulSoup) -> Dict[str, Any]:
-        include_text = bool(self.config.get("raw_include_text", True))
+    @staticmethod
+    def _build_strainer(selectors: List[soupsieve.SoupSieve]) -> Optional[SoupStrainer]:
+        """Return a strainer that only builds the elements ``selectors`` can match.
+
+        Matching elements are kept with their whole subtree, but their ancestors
+        are dropped, so this is only safe when every selector is a tag-qualified
+        compound (``div.question``, ``img[src]``). Combinators, pseudo-classes or
+        bare class/id selectors return ``None`` and the full page is parsed.
+        """
+        names = set()
+        for selector in selectors:
+            for part in selector.pattern.split(","):
+                match = _SIMPLE_SELECTOR.match(part.strip())
+                if match is None:
+                    return None
+                names.add(match.group(1).lower())
+        return SoupStrainer(sorted(names))
+
+    def _parse_tree(self, html: str) -> Any:
+        if self._html_parser == _SELECTOLAX:
+            return LexborHTMLParser(html)
+        return BeautifulSoup(html, self._html_parser)
+
+    def _raw_needs_soup(self) -> bool:
+        # With worker processes, text, tables and images are all extracted there.
+        if self._text_executor is not None:
+            return False
+        return self._raw_include_text or bool(self._media)
+
+    def _capture_raw(
+        self, url: str, status_code: int, html: str, soup: Optional[Any]
+    ) -> Dict[str, Any]:
         data: Dict[str, Any] = {
             "url": url,
-            "status_code": response.status_code,
-            # Use timezone-aware UTC datetime
-            "retrieved_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-            "raw_html": response.text,
+            "status_code": status_code,
+            "retrieved_at": _utc_timestamp(),
+            "raw_html": html,
         }
-        if include_text:
-            data["raw_text"] = soup.get_text(separator="\n", strip=True)
+        if self._text_executor is not None:
+            text, tables, images = self._text_executor.submit(_extract_raw_page, html, url).result()
+        elif soup is not None:
+            # Media first, as in _extract_raw_page: _tree_text strips <script> and <style> from
+            # a Lexbor tree, which would change what sibling and :nth-* selectors match.
+            tables, images = self._media.extract(soup, url)
+            text = _tree_text(soup) if self._raw_include_text else None
+        else:
+            return data
+        if text is not None:
+            data["raw_text"] = text
+        self._add_media(data, tables, images)
         return data
 
-    def _extract_tables(self, soup: BeautifulSoup) -> List[List[List[str]]]:
-        tables: List[List[List[str]]] = []
-        selectors = self.config.get("table_selectors") or []
-        if isinstance(selectors, str):
-            selectors = [selectors]
-
-        if not isinstance(selectors, list):
-            return tables
-
-        for selector in selectors:
-            if not isinstance(selector, str) or not selector:
-                continue
-            for table_tag in soup.select(str(selector)):
-                parsed_table = self._parse_html_table(table_tag)
-                if parsed_table:
-                    tables.append(parsed_table)
-        return tables
+    @staticmethod
+    def _add_media(data: Dict[str, Any], tables: List[List[List[str]]], images: List[str]) -> None:
+        if tables:
+            data["tables"] = tables
+        if images:
+            data["images"] = images
 
-    def _extract_images(self, soup: BeautifulSoup, base_url: str) -> List[str]:
-        images: List[str] = []
-        selectors = self.config.get("image_selectors") or []
+    def _get_selector_list(self, key: str) -> List[str]:
+        selectors = self.config.get(key) or []
         if isinstance(selectors, str):
             selectors = [selectors]
-
         if not isinstance(selectors, list):
-            return images
-
-        for selector in selectors:
-            if not isinstance(selector, str) or not selector:
-                continue
-            for image_tag in soup.select(str(selector)):
-                src = image_tag.get("src")
-                if not isinstance(src, str) or not src:
-                    continue
-                absolute_url = urljoin(base_url, str(src))
-                if absolute_url not in images:
-                    images.append(absolute_url)
-        return images
-
-    def _parse_html_table(self, table: Tag) -> List[List[str]]:
-        rows: List[List[str]] = []
-        for row in table.find_all("tr"):
-            cells = [str(cell.get_text(strip=True)) for cell in row.find_all(["th", "td"])]
-            if cells:
-                rows.append(cells)
-        return rows
+            return []
+        return [selector for selector in selectors if isinstance(selector, str) and selector]
 
     def _require_config_value(self, key: str) -> Any:
         value = self.config.get(key)
@@ -319,90 +1321,8 @@ class Scraper:
 
     def _emit_status(self, message: str) -> None:
         if self.status_callback:
-            self.status_callback(message)
-
-    # ------------------------------------------------------------------
-    # Persistence helpers
-    # ------------------------------------------------------------------
-    def _save_to_csv(self, data: List[Dict[str, Any]], output_path: Path) -> None:
-        fieldnames = self._collect_fieldnames(data)
-        list_fields = {"answers", "tables", "images"}
-        with output_path.open("w", encoding="utf-8", newline="") as csv_file:
-            writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
-            writer.writeheader()
-            for row in data:
-                csv_row: Dict[str, Any] = {}
-                for field in fieldnames:
-                    value = row.get(field)
-                    if field in list_fields and isinstance(value, list):
-                        value = json.dumps(value, ensure_ascii=False)
-                    csv_row[field] = self._coerce_for_csv(value)
-                writer.writerow(csv_row)
-
-    def _save_to_json(self, data: List[Dict[str, Any]], output_path: Path) -> None:
-        with output_path.open("w", encoding="utf-8") as json_file:
-            json.dump(data, json_file, ensure_ascii=False, indent=2)
-
-    def _save_to_sqlite(self, data: List[Dict[str, Any]], output_path: Path) -> None:
-        table_name = "scraped_data"
-        fieldnames = self._collect_fieldnames(data)
-        list_fields = {"answers", "tables", "images"}
-        connection = sqlite3.connect(output_path)
-        try:
-            cursor = connection.cursor()
-            columns_sql = ",\n".join(f'"{name}" TEXT' for name in fieldnames)
-            cursor.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    {columns_sql}
-                )
-                """
-            )
-
-            placeholders = ", ".join("?" for _ in fieldnames)
-            column_list = ", ".join(f'"{name}"' for name in fieldnames)
-            insert_sql = f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})"
-
-            rows: List[List[Any]] = []
-            for row in data:
-                sqlite_row: List[Any] = []
-                for field in fieldnames:
-                    value = row.get(field)
-                    if field in list_fields and isinstance(value, list):
-                        value = json.dumps(value, ensure_ascii=False)
-                    sqlite_row.append(self._coerce_for_sqlite(value))
-                rows.append(sqlite_row)
-
-            cursor.executemany(insert_sql, rows)
-            connection.commit()
-        finally:
-            connection.close()
-
-    def _collect_fieldnames(self, data: List[Dict[str, Any]]) -> List[str]:
-        fieldnames: List[str] = []
-        for row in data:
-            for key in row.keys():
-                if key not in fieldnames:
-                    fieldnames.append(key)
-        for required in ("tables", "images"):
-            if required not in fieldnames:
-                fieldnames.append(required)
-        return fieldnames
-
-    def _coerce_for_csv(self, value: Any) -> Any:
-        if value is None:
-            return ""
-        if isinstance(value, (list, dict)):
-            return json.dumps(value, ensure_ascii=False)
-        return value
-
-    def _coerce_for_sqlite(self, value: Any) -> Any:
-        if value is None:
-            return None
-        if isinstance(value, (list, dict)):
-            return json.dumps(value, ensure_ascii=False)
-        return value
+            with self._status_lock:
+                self.status_callback(message)
 
 
-__all__ = ["Scraper", "ScraperError", "ConfigError", "LoginError", "ScrapeError"]
+__all__ = ["Scraper", "ScraperError", "ConfigError", "LoginError", "ScrapeError", "load_config"]